@@ -31,13 +31,22 @@ from typing import Optional
 
 BEGIN_MARKER = "<!-- BEGIN USER CUSTOM DESCRIPTION -->"
 END_MARKER = "<!-- END USER CUSTOM DESCRIPTION -->"
+USER_BLOCK_RE = re.compile(
+    re.escape(BEGIN_MARKER) + r"(.*?)" + re.escape(END_MARKER), re.S
+)
 
 API_BASE = "https://api.github.com"
 
 
 def run(cmd: list[str]) -> str:
-    """运行shell命令并返回输出"""
-    return subprocess.check_output(cmd, text=True).strip()
+    """运行shell命令并返回输出（stderr 丢弃，失败抛出 CalledProcessError）"""
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        check=True,
+    ).stdout.strip()
 
 
 def get_env_tag() -> Optional[str]:
@@ -60,15 +69,11 @@ def get_repo() -> str:
 
 
 def get_previous_tag(current_tag: str) -> Optional[str]:
-    """获取前一个标签（按创建日期排序）"""
+    """获取前一个标签（当前标签父提交可达的最近标签）"""
     try:
-        tags = run(["git", "tag", "--sort=-creatordate"]).splitlines()
+        return run(["git", "describe", "--tags", "--abbrev=0", f"{current_tag}^"])
     except subprocess.CalledProcessError:
         return None
-    for t in tags:
-        if t != current_tag:
-            return t
-    return None
 
 
 def get_commit_list(prev: Optional[str], tag: str) -> str:
@@ -111,9 +116,7 @@ def extract_user_block(existing_body: Optional[str]) -> str:
     """从现有发布正文中提取用户自定义区块"""
     if not existing_body:
         return "\n*在此处添加您的自定义发布说明*\n"
-    m = re.search(
-        re.escape(BEGIN_MARKER) + r"(.*?)" + re.escape(END_MARKER), existing_body, re.S
-    )
+    m = USER_BLOCK_RE.search(existing_body)
     if m:
         return m.group(1).strip() + "\n"
     return "\n*在此处添加您的自定义发布说明*\n"
@@ -143,12 +146,12 @@ def main():
     args = parser.parse_args()
 
     tag = get_env_tag()
-    if not tag.startswith("v"):
-        print("跳过无效版本标签")
-        sys.exit(0)
     if not tag:
         print("错误：未检测到标签。请确保在标签推送时运行或设置TAG_NAME环境变量。")
         sys.exit(1)
+    if not tag.startswith("v"):
+        print("跳过无效版本标签")
+        sys.exit(0)
 
     repo = get_repo()
     token = os.environ.get("GITHUB_TOKEN")
@@ -156,11 +159,6 @@ def main():
         print("错误：应用更改需要GITHUB_TOKEN环境变量")
         sys.exit(1)
 
-    prev = get_previous_tag(tag)
-    commits = get_commit_list(prev, tag)
-
-    programmatic = commits
-
     existing_release = None
     existing_body = None
     existing_id = None
@@ -173,8 +171,12 @@ def main():
             existing_body = existing.get("body")
             existing_id = existing.get("id")
 
+    # git 查询放在所有校验之后，无效输入不必启动子进程
+    prev = get_previous_tag(tag)
+    commits = get_commit_list(prev, tag)
+
     user_block = extract_user_block(existing_body)
-    body = compose_body(programmatic, user_block)
+    body = compose_body(commits, user_block)
 
     if args.dry_run or not args.apply:
         print(body)
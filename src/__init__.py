@@ -3,7 +3,7 @@ from .abc.api_base import APIBase
 from .abc.builder import MessageBuilder
 from .abc.nodes import MessageNode
 from .abc.protocol_abc import APIBaseT, ProtocolABC
-from .adapters import protocols  # 加载协议
+from .adapters import protocols  # 可用协议名，协议本身按需加载
 from .core.client import IMClient
 from .core.IM import (
     Group,
@@ -8,6 +8,7 @@ import aiofiles.os
 
 from .abc.protocol_abc import ProtocolABC, ProtocolMeta
 from .connector import AsyncWebSocketClient
+from .connector.abc import WebSocketError
 from .core.client import IMClient
 from .plugins_system import Event, EventBus, PluginApplication
 from .utils.constants import DefaultSetting, ProtocolName
@@ -15,6 +16,19 @@ from .utils.constants import DefaultSetting, ProtocolName
 log = logging.getLogger("Bot")
 One_Mod = True
 
+# 导入时算好，避免每次实例化都 resolve（readlink）
+_SYS_PLUGIN_DIR = Path(__file__).resolve().parent / "sys_plugin"
+_RBAC_SUBPATH = Path("Ncatbot") / "rbac.json"
+
+
+def _loop_factory():
+    """优先使用 uvloop（可选依赖 perf），不可用时回退到 asyncio 默认事件循环"""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
 
 class Router:
     def __init__(self):
@@ -26,6 +40,9 @@ class Bot:
 
     # --- 类级状态 ---
     running: ClassVar[bool] = False  # 是否有实例在运行
+    batch_size: ClassVar[int] = 64  # 单次唤醒最多处理的消息数
+    print_queue_size: ClassVar[int] = 1024  # 待打印事件上限，满时丢弃最旧的
+    _dir_ready: ClassVar[set[Path]] = set()  # 已确认存在的目录
 
     # --- 实例级属性 ---
     plugin_sys: PluginApplication
@@ -33,6 +50,9 @@ class Bot:
     _protocol: ProtocolABC
     _im_client: IMClient
     _stop_event: asyncio.Event
+    _print_queue: asyncio.Queue
+    _print_task: Optional[asyncio.Task]
+    _stop_task: Optional[asyncio.Task]
 
     def __init__(
         self,
@@ -50,7 +70,7 @@ class Bot:
         self.root_id = str(root_id)
 
         # 插件系统
-        plugin_dirs = [Path(__file__).resolve().parent / "sys_plugin"]
+        plugin_dirs = [_SYS_PLUGIN_DIR]
         if plugin_dir:
             plugin_dirs.append(plugin_dir)
 
@@ -64,11 +84,21 @@ class Bot:
         )
         self.event_bus: EventBus = self.plugin_sys.event_bus
 
+        # 启动与退出共用的路径，只算一次
+        self._rbac_tree = (self.plugin_sys.data_dir / _RBAC_SUBPATH).absolute()
+        self._ncatbot_config_dir = self.plugin_sys.config_dir / "Ncatbot"
+
         protocol_class = ProtocolMeta.get_protocol(protocol)
         self._protocol: ProtocolABC = protocol_class(debug)
 
         # 停止信号
         self._stop_event = asyncio.Event()
+        self._stop_task = None
+        self.listener: Optional[str] = None
+
+        # 事件打印放到后台任务，不阻塞收消息
+        self._print_queue = asyncio.Queue(maxsize=self.print_queue_size)
+        self._print_task = None
 
         self.token = token
         if token is None:
@@ -102,8 +132,9 @@ class Bot:
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
-            # 没有正在运行的循环，用 asyncio.run
-            asyncio.run(_runner())
+            # 没有正在运行的循环，新建（可用时为 uvloop）
+            with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+                runner.run(_runner())
         else:
             # 已有循环（Jupyter / 测试框架）
             loop.run_until_complete(_runner())
@@ -116,6 +147,7 @@ class Bot:
             raise RuntimeError("Bot 实例已经在运行，不允许重复启动")
         Bot.running = True
         self._stop_event.clear()
+        self._stop_task = None
 
         # NOTE 用了会变的不幸
         # # 注册系统信号，支持 docker / 终端 kill
@@ -134,16 +166,15 @@ class Bot:
             # 实例化 IMClient
             self._im_client = IMClient(self.protocol)
 
-            # 初始化内部插件
-            Path(self.plugin_sys.config_dir / "Ncatbot").mkdir(
-                parents=True, exist_ok=True
-            )
+            rbac_path = self._rbac_tree
 
-            rbac_path = self.plugin_sys.data_dir / "Ncatbot" / "rbac.json"
+            # 初始化内部插件目录与 RBAC 目录（异步并发创建）
+            await asyncio.gather(
+                self._ensure_dir(self._ncatbot_config_dir),
+                self._ensure_dir(rbac_path.parent),
+            )
 
             try:
-                # 确保目录存在（异步）
-                await aiofiles.os.makedirs(rbac_path.parent, exist_ok=True)
                 if not await aiofiles.os.path.exists(rbac_path):
                     self._im_client.save_rbac_tree(rbac_path)
 
@@ -167,12 +198,32 @@ class Bot:
 
             log.info("IMClient 启动完成，Bot 开始工作 ...")
 
-            while not self._stop_event.is_set():
-                await self._cat()
-            await asyncio.sleep(0.1)  # 让出时间片，确保清理任务能运行
+            self._print_task = asyncio.create_task(self._printer_loop())
+
+            # 热循环内只用局部变量，避免逐条消息重复查找属性
+            get_batch = self.ws.get_messages_batch
+            listener_id = self.listener
+            batch_size = self.batch_size
+            parse = self.protocol._parse_event
+            queue_print = self._queue_print
+            publish = self.event_bus.publish_event
+            stop_is_set = self._stop_event.is_set
+
+            while not stop_is_set():
+                # 一次唤醒处理所有已到达的消息
+                try:
+                    batch = await get_batch(listener_id, batch_size)
+                except WebSocketError:
+                    # stop() 会关闭监听器以唤醒这里的等待
+                    if stop_is_set():
+                        break
+                    raise
+                for raw in batch:
+                    event = parse(raw)
+                    if isinstance(event, Event):
+                        queue_print(event)
+                        publish(event)
 
-        except KeyboardInterrupt:
-            await self.stop()
         except Exception as e:
             if self.debug:
                 raise e
@@ -181,43 +232,67 @@ class Bot:
         finally:
             Bot.running = False
 
-    # ---------- 内部运行 ----------
-    async def _cat(self) -> None:
-        ws = self.ws
-        protocol = self.protocol
-        event_bus = self.event_bus
-        listener_id = self.listener
-
-        raw = await ws.get_message(listener_id)
-        if raw:
-            event = protocol._parse_event(raw)
-            if isinstance(event, Event):
-                await protocol.print_event(event)
-                event_bus.publish_event(event)
-
     # ---------- 优雅退出 ----------
     async def stop(self) -> None:
-        log.info("Bot 正在退出 ...")
-        tasks = []
-
-        # 关闭插件系统
-        tasks.append(
-            asyncio.create_task(
-                self._safe_coro("plugin_sys.stop", self.plugin_sys.stop())
-            )
-        )
+        """停止 Bot，可重复调用
 
-        await self.protocol.logout()
+        插件、run_async 的出错路径和 run() 的收尾都可能调用 stop()，
+        清理只执行一次，之后的调用等待同一次清理完成
+        """
+        if self._stop_task is None:
+            self._stop_task = asyncio.create_task(self._shutdown())
+        # shield：调用方被取消时不中断清理
+        await asyncio.shield(self._stop_task)
 
-        # 等待所有清理任务完成（超时 5s）
-        await asyncio.wait(tasks, timeout=5)
+    async def _shutdown(self) -> None:
+        log.info("Bot 正在退出 ...")
+        # 先发出停止信号并关闭监听器，让 run_async 的收消息循环退出
         self._stop_event.set()
+        if self.listener is not None:
+            await self.ws.remove_listener(self.listener)
+            self.listener = None
 
-        rbac_tree = Path(self.plugin_sys.data_dir / "Ncatbot" / "rbac.json")
-        await aiofiles.os.makedirs(rbac_tree.parent, exist_ok=True)
-        IMClient.save_rbac_tree(rbac_tree.absolute())
+        # 关闭插件系统与登出互不依赖，并发执行
+        tasks = [
+            asyncio.create_task(
+                self._safe_coro("plugin_sys.stop", self.plugin_sys.stop())
+            ),
+            asyncio.create_task(
+                self._safe_coro("protocol.logout", self.protocol.logout())
+            ),
+        ]
+
+        # 等待所有清理任务完成（超时 5s），超时未完成的取消
+        _, pending = await asyncio.wait(tasks, timeout=5)
+        for task in pending:
+            task.cancel()
+        if self._print_task is not None:
+            self._print_task.cancel()
+            self._print_task = None
+
+        # 目录在 run_async 中已创建；若被删除，save_rbac_tree 会自行补建
+        IMClient.save_rbac_tree(self._rbac_tree)
         log.info("Bot 已完全停止")
-        raise KeyboardInterrupt()
+
+    # ---------- 事件打印 ----------
+    def _queue_print(self, event: Event) -> None:
+        """将事件交给后台打印，队列满时丢弃最旧的一条"""
+        try:
+            self._print_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._print_queue.get_nowait()
+            self._print_queue.put_nowait(event)
+
+    async def _printer_loop(self) -> None:
+        """后台打印事件，异常只记录不退出"""
+        queue = self._print_queue
+        print_event = self.protocol.print_event
+        while True:
+            event = await queue.get()
+            try:
+                await print_event(event)
+            except Exception:
+                log.exception("事件打印失败")
 
     # ---------- 工具 ----------
     def _request_shutdown(self) -> None:
@@ -225,6 +300,13 @@ class Bot:
         if not self._stop_event.is_set():
             self._stop_event.set()
 
+    async def _ensure_dir(self, path: Path) -> None:
+        """异步创建目录，同一目录只创建一次"""
+        if path in Bot._dir_ready:
+            return
+        await aiofiles.os.makedirs(path, exist_ok=True)
+        Bot._dir_ready.add(path)
+
     async def _safe_coro(self, name: str, coro) -> None:
         """捕获并记录清理阶段的异常，避免掩盖主异常"""
         try:
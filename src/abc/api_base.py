@@ -2,92 +2,133 @@
 """
 纯通信层 - 只负责发送和自动包装，不定义具体接口
 """
-import asyncio
 import functools
 import inspect
-from abc import ABC, ABCMeta, abstractmethod
+import sys
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiRequest(Generic[T]):
-    """API请求定义"""
+    """API请求定义（slots：每次调用都会创建，省去实例 __dict__）"""
 
     activity: str  # 操作名称
     data: Dict[str, Any]  # 请求数据
     headers: Optional[Dict[str, str]] = None  # 可选的请求头
 
 
-class ApiMeta(ABCMeta):
-    """API元类 - 自动包装所有方法到invoke"""
+def api(activity: str) -> Callable[[Callable[..., Optional[Dict[str, Any]]]], Any]:
+    """声明一个 API 方法
 
-    abc = True
+    被装饰的函数是同步的参数构造器，返回请求数据字典（返回 None 表示不发送）。
+    装饰后得到可直接 await 的异步方法，调用时只有这一层协程
 
-    def __new__(mcs, name, bases, namespace):
-        cls = super().__new__(mcs, name, bases, namespace)
+    Examples:
+        @api("send_group_msg")
+        def send_group_message(self, group_id, message):
+            return {"group_id": group_id, "message": message}
 
-        # 跳过抽象基类
-        if cls.abc:
-            return cls
-
-        assert isinstance(namespace, dict)
-
-        # 自动包装所有公共的异步方法
-        for attr_name, attr_value in namespace.items():
-            assert isinstance(attr_name, str)
+    Args:
+        activity: 操作名称
+    """
+    # 类定义时驻留一次；标识符形式的字面量本就会被驻留，这里兜底 ".ocr_image" 这类名称
+    activity = sys.intern(activity)
 
-            # 跳过特殊方法本身
-            if attr_name in ("invoke", "call"):
-                continue
+    def decorator(builder: Callable[..., Optional[Dict[str, Any]]]):
+        @functools.wraps(builder)
+        async def method(self: "APIBase", *args, **kwargs):
+            data = builder(self, *args, **kwargs)
+            if data is None:
+                return None
+            return await self.invoke(ApiRequest(activity, data))
 
-            if attr_name.startswith("_"):
-                continue
+        method._api_activity = activity
+        return method
 
-            if asyncio.iscoroutinefunction(attr_value):
-                # 创建包装器
-                def make_wrapper(original_method):
-                    @functools.wraps(original_method)
-                    async def wrapper(self, *args, **kwargs):
-                        assert isinstance(self, APIBase)
+    return decorator
 
-                        # 调用原始方法获取请求定义
-                        original_result = await original_method(self, *args, **kwargs)
 
-                        # 处理不同类型的返回值
-                        if isinstance(original_result, ApiRequest):
-                            # 直接使用ApiRequest
-                            return await self.invoke(original_result)
-                        elif (
-                            isinstance(original_result, tuple)
-                            and len(original_result) == 2
-                        ):
-                            # 返回 (activity, data) 元组
-                            activity, data = original_result
-                            return await self.invoke(ApiRequest(activity, data))
-                        else:
-                            # 原始方法已经处理了请求，直接返回结果
-                            return original_result
+def _wrap_legacy(original_method: Callable) -> Callable:
+    """兼容旧写法：包装返回 ApiRequest 或 (activity, data) 的异步方法"""
 
-                    return wrapper
+    @functools.wraps(original_method)
+    async def wrapper(self: "APIBase", *args, **kwargs):
+        # 调用原始方法获取请求定义
+        original_result = await original_method(self, *args, **kwargs)
 
-                setattr(cls, attr_name, make_wrapper(attr_value))
+        # 处理不同类型的返回值
+        if isinstance(original_result, ApiRequest):
+            # 直接使用ApiRequest
+            return await self.invoke(original_result)
+        elif isinstance(original_result, tuple) and len(original_result) == 2:
+            # 返回 (activity, data) 元组
+            activity, data = original_result
+            return await self.invoke(ApiRequest(activity, data))
+        else:
+            # 原始方法已经处理了请求，直接返回结果
+            return original_result
 
-        return cls
+    return wrapper
 
 
-class APIBase(ABC, metaclass=ApiMeta):
+class APIBase(ABC):
     """
     纯通信层基类
     只负责两件事
     1. 实现invoke方法进行实际通信
-    2. 自动包装所有方法到invoke调用
+    2. 将 @api 方法（及旧式返回元组的异步方法）转发到invoke调用
 
     不定义任何具体接口，协议开发者可以自由定义方法
     """
 
+    abc: ClassVar[bool] = True  # 为 True 时不包装旧式方法，具体 API 类设为 False
+    _api_methods: ClassVar[Tuple[str, ...]] = ()  # 公共异步方法名
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        namespace = cls.__dict__
+
+        # 公共异步方法名，类创建时算好，list_api_methods 直接返回
+        api_methods = set()
+        for base in cls.__mro__[1:]:
+            api_methods.update(base.__dict__.get("_api_methods", ()))
+
+        legacy = []
+        for attr_name, attr_value in namespace.items():
+            # 跳过私有成员与特殊方法本身
+            if attr_name.startswith("_") or attr_name in ("invoke", "call"):
+                continue
+
+            if hasattr(attr_value, "_api_activity"):
+                # @api 方法已经自行调用 invoke
+                api_methods.add(attr_name)
+            elif inspect.iscoroutinefunction(attr_value):
+                api_methods.add(attr_name)
+                legacy.append(attr_name)
+
+        cls._api_methods = tuple(sorted(api_methods))
+
+        # 抽象基类不包装
+        if cls.abc:
+            return
+
+        for attr_name in legacy:
+            setattr(cls, attr_name, _wrap_legacy(namespace[attr_name]))
+
     # ========== 底层方法 ==========
     @abstractmethod
     async def invoke(self, request: ApiRequest[Any]) -> Any:
@@ -110,14 +151,15 @@ class APIBase(ABC, metaclass=ApiMeta):
 
     def list_api_methods(self) -> List[str]:
         """列出所有API方法"""
-        methods = []
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            if not name.startswith("_") and asyncio.iscoroutinefunction(method):
-                methods.append(name)
-        return methods
+        return list(type(self)._api_methods)
 
     def __getattr__(self, name: str):
         """动态调用任意API方法"""  # 如果没有定义
+        if name.startswith("__"):
+            # 魔术属性探测（copy/pickle 等）不应被当作 API
+            raise AttributeError(name)
+
+        invoke = self.invoke
 
         async def dynamic_method(*args, **kwargs):
             if args:  # 只要出现位置参数就报错
@@ -125,6 +167,9 @@ class APIBase(ABC, metaclass=ApiMeta):
                     f"{name} 仅接受关键字参数，请使用 key=value 形式调用，避免桥接 API 时参数顺序与远端不一致"
                 )
             # 纯关键字参数
-            return await self.invoke(ApiRequest[Any](name, kwargs))
+            return await invoke(ApiRequest(name, kwargs))
 
+        dynamic_method.__name__ = name
+        # 缓存到实例上，下次访问不再进入 __getattr__
+        self.__dict__[name] = dynamic_method
         return dynamic_method
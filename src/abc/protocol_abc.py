@@ -5,9 +5,20 @@
 """
 from __future__ import annotations
 
+import importlib
 from abc import ABC, ABCMeta, abstractmethod
-from ast import Tuple
-from typing import TYPE_CHECKING, Any, Dict, Generic, List, NewType, Optional, TypeVar
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    NewType,
+    Optional,
+    TypeVar,
+)
 
 from ..plugins_system.core.events import Event
 from .api_base import APIBase
@@ -36,11 +47,16 @@ RawUser = NewType("RawUser", object)
 RawGroup = NewType("RawGroup", object)
 RawDate = NewType("RawDate", str)
 
+# 内置协议所在的包（src.adapters），协议子包按需导入
+_ADAPTERS_PACKAGE = f"{__package__.rpartition('.')[0]}.adapters"
+
 
 class ProtocolMeta(ABCMeta):
     """自动收集所有协议子类"""
 
-    _protocols: Dict[str, "ProtocolABC"] = {}
+    _registry: Dict[str, "ProtocolABC"] = {}
+    # 对外只读视图，注册只能经由元类
+    _protocols: Mapping[str, "ProtocolABC"] = MappingProxyType(_registry)
 
     def __new__(mcls, name, bases, namespace: Dict[str, Any]):
         cls = super().__new__(mcls, name, bases, namespace)
@@ -51,24 +67,39 @@ class ProtocolMeta(ABCMeta):
 
         protocol_name = namespace.get("protocol_name")
         if protocol_name:
-            if protocol_name in mcls._protocols:
+            if protocol_name in mcls._registry:
                 raise ValueError(f"协议名称 '{protocol_name}' 已被占用")
-            mcls._protocols[protocol_name] = cls
+            mcls._registry[protocol_name] = cls
         return cls
 
     @classmethod
     def get_protocol(cls, protocol_name: str) -> ProtocolABC:
-        """获取指定协议类"""
+        """获取指定协议类（未注册时尝试按需导入 src.adapters 下的同名子包）"""
         protocol = cls._protocols.get(protocol_name)
-        if not protocol:
-            raise TypeError(f"无效的协议 {protocol_name}, 可用协议: {cls._protocols}")
+        if protocol is None:
+            module_name = f"{_ADAPTERS_PACKAGE}.{protocol_name}"
+            try:
+                importlib.import_module(module_name)
+            except ModuleNotFoundError as e:
+                # 只吞掉"协议子包不存在"，子包内部的导入错误照常抛出
+                if e.name != module_name:
+                    raise
+            protocol = cls._protocols.get(protocol_name)
+        if protocol is None:
+            raise TypeError(
+                f"无效的协议 {protocol_name}, 可用协议: {cls.list_protocols()}"
+            )
         # TODO 自动类型检查
         return protocol
 
     @classmethod
     def list_protocols(cls) -> List[str]:
-        """列出所有已注册的协议"""
-        return list(cls._protocols.keys())
+        """列出所有可用协议（已注册的，加上 src.adapters 中尚未加载的内置协议）"""
+        names = list(cls._protocols)
+        # 延迟导入：src.adapters 依赖本模块
+        builtin = importlib.import_module(_ADAPTERS_PACKAGE).protocols
+        names.extend(name for name in builtin if name not in cls._protocols)
+        return names
 
 
 class ProtocolABC(Generic[APIBaseT, MessageBuilderT], ABC, metaclass=ProtocolMeta):
@@ -153,7 +184,7 @@ class ProtocolABC(Generic[APIBaseT, MessageBuilderT], ABC, metaclass=ProtocolMet
     # ========== 必须实现的解析方法 ==========
     @abstractmethod
     def _parse_event(
-        self, raw: Tuple[RawDate, MessageType]
+        self, raw: tuple[RawDate, MessageType]
     ) -> Event | None:  # 服务器的主动推送
         """
         解析事件
@@ -14,8 +14,12 @@ from ..core.IM import Group, GroupInfo, Me, Message, MessageInfo, User, UserInfo
 
 protocols = ("napcat",)
 
-for p in protocols:
-    importlib.import_module(f".{p}", package=__package__)
+
+def __getattr__(name: str):
+    """按需导入协议子包，未用到的协议不在启动时加载"""
+    if name in protocols:
+        return importlib.import_module(f".{name}", package=__package__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
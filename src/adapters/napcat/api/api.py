@@ -1,5 +1,5 @@
 from ....connector import AsyncWebSocketClient
-from .api_base import NCAPIBase
+from .api_base import NCAPIBase, _ResponseRouter
 from .group import NCAPIGroup
 from .message import NCAPIMessage
 from .system import NCAPISystem
@@ -18,11 +18,21 @@ class NCAPI(NCAPIBase):
         self.group = NCAPIGroup()
         self.system = NCAPISystem()
         self.message = NCAPIMessage()
+        # 需要共享客户端的全部实例，新增子 API 只需加到这里
+        self._apis: tuple[NCAPIBase, ...] = (
+            self,
+            self.user,
+            self.group,
+            self.system,
+            self.message,
+        )
 
     def set_client(self, client: AsyncWebSocketClient):
         """设置 WebSocket 客户端并共享给所有子 API"""
-        self.client = client
-        self.user.client = client
-        self.group.client = client
-        self.system.client = client
-        self.message.client = client
+        if self._router is not None:
+            self._router.close()
+        # 所有子 API 共用一个响应分发器，每帧只解析一次
+        router = _ResponseRouter(client)
+        for api in self._apis:
+            api.client = client
+            api._router = router
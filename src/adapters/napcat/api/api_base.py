@@ -1,19 +1,123 @@
+import asyncio
+import itertools
 import json
 import logging
 import uuid
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Set
 
 from src.abc.api_base import APIBase, ApiRequest
 from src.connector import AsyncWebSocketClient, MessageType
+from src.connector.abc import WebSocketError
+from src.exceptions.api import ApiTimeout
+from src.utils.json_compat import dumps as json_dumps
+from src.utils.json_compat import loads as json_loads
 
 log = logging.getLogger("NCAPI")
 
+# echo 只需在本进程的在途请求中唯一：随机前缀 + 自增序号，不必每次读 urandom
+_ECHO_PREFIX = f"{uuid.uuid4().hex[:8]}-"
+_echo_seq = itertools.count()
+
+# 超过该长度的响应（如大群成员列表）放到线程里解析，避免阻塞事件循环
+_THREAD_PARSE_SIZE = 64 * 1024
+
+# 持有 close() 中创建的清理任务，避免被提前回收
+_background_tasks: Set[asyncio.Task] = set()
+
+
+class _ResponseRouter:
+    """按 echo 分发 API 响应
+
+    每个客户端只有一个监听器和一个后台读取任务，每帧只解析一次，
+    再交给对应 echo 的 Future
+    """
+
+    def __init__(self, client: AsyncWebSocketClient):
+        self.client = client
+        self.pending: Dict[str, asyncio.Future] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._listener_id: Optional[str] = None
+
+    def close(self) -> None:
+        """停止读取任务并释放监听器（客户端被替换时调用）"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        # 取消读取任务不会走 _fail_pending，这里让在途请求立即失败而不是等到超时
+        self._fail_pending(ConnectionError("WebSocket 客户端已被替换"))
+
+        listener_id, self._listener_id = self._listener_id, None
+        if listener_id is None:
+            return
+        # 旧客户端可能仍在运行，不移除监听器会一直缓存消息
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # 没有运行中的循环时监听器也不会再收到消息
+        task = loop.create_task(self.client.remove_listener(listener_id))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    async def start(self) -> None:
+        """确保读取任务在运行（监听器失效后会重建）"""
+        if self._task is None or self._task.done():
+            if self._listener_id is not None:
+                # 读取任务异常退出时监听器可能仍在，先移除
+                await self.client.remove_listener(self._listener_id)
+            self._listener_id = await self.client.create_listener()
+            self._task = asyncio.create_task(self._read_loop(self._listener_id))
+
+    async def _read_loop(self, listener_id: str) -> None:
+        # 循环内只用局部变量，避免逐帧查找属性和全局名
+        get_batch = self.client.get_messages_batch
+        pending = self.pending
+        pop = pending.pop
+        loads = json_loads
+        to_thread = asyncio.to_thread
+        # 枚举成员是单例，直接比较身份
+        text, binary = MessageType.Text, MessageType.Binary
+        try:
+            while True:
+                for message, t in await get_batch(listener_id):
+                    # 二进制帧同样按 JSON 解析（json/orjson 都接受 bytes）
+                    if t is not text and t is not binary:
+                        continue
+                    try:
+                        if len(message) > _THREAD_PARSE_SIZE:
+                            resp = await to_thread(loads, message)
+                        else:
+                            resp = loads(message)
+                    except json.JSONDecodeError as e:  # orjson 的异常是其子类
+                        log.error("解析错误: %s", e)
+                        continue
+                    if not isinstance(resp, dict):
+                        continue
+                    future = pop(resp.get("echo"), None)
+                    if future is not None and not future.done():
+                        future.set_result(resp)
+        except WebSocketError as e:
+            # 监听器被淘汰或关闭：让在途请求立即失败，下次调用时重建
+            self._fail_pending(e)
+        except Exception as e:
+            # 其他异常同样会结束读取任务，记录后按同样方式处理，避免请求只能等到超时
+            log.exception("响应读取任务异常退出")
+            self._fail_pending(e)
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        """让所有在途请求以 exc 失败"""
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        self.pending.clear()
+
 
 class NCAPIBase(APIBase):
     """napcatAPI基类"""
 
     protocol_name = "napcat"
-    client: AsyncWebSocketClient
+    client: Optional[AsyncWebSocketClient] = None  # 由 NCAPI.set_client 设置
+    timeout: float = 10  # 单次 API 调用等待响应的秒数
+    _router: Optional[_ResponseRouter] = None  # NCAPI.set_client 会让各子 API 共用
 
     def __init__(self):
         super().__init__()
@@ -27,25 +131,30 @@ class NCAPIBase(APIBase):
 
     async def invoke(self, request: ApiRequest) -> dict | None:
         """调用 NapCat API 并返回响应数据"""
-        if not getattr(self, "client", None):
+        client = self.client
+        if client is None:
             raise RuntimeError("WebSocket 客户端未初始化，请先调用 login")
 
-        listener_id = await self.client.create_listener()
-        echo = str(uuid.uuid4())
-        request_data = self.to_dict(request) | {"echo": echo}
-        await self.client.send(request_data)
+        router = self._router
+        if router is None or router.client is not client:
+            router = self._router = _ResponseRouter(client)
+        await router.start()
 
-        while True:
-            message, t = await self.client.get_message(listener_id, timeout=10)
-            match t:
-                case MessageType.Text:
-                    try:
-                        resp: dict = json.loads(message)
-                    except json.JSONDecodeError as e:
-                        log.error("解析错误: %s", e)
-                        return None
-                    if resp.get("echo") == echo:
-                        return resp  # 正常路径直接返回
-                case _:
-                    log.error("未知类型返回: %s", request.activity)
-                    return None
+        echo = f"{_ECHO_PREFIX}{next(_echo_seq)}"
+        # 先登记再发送，避免响应早于登记到达
+        future = asyncio.get_running_loop().create_future()
+        pending = router.pending
+        pending[echo] = future
+        try:
+            # 直接写入 to_dict 返回的字典，不再额外合并出一个新字典
+            payload = self.to_dict(request)
+            payload["echo"] = echo
+            await client.send(json_dumps(payload))
+            # 整个调用只有一个截止时间
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            raise ApiTimeout(
+                self.protocol_name, request.activity, self.timeout
+            ) from None
+        finally:
+            pending.pop(echo, None)
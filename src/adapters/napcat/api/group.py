@@ -1,5 +1,6 @@
 from typing import Any, List, Union
 
+from ....abc.api_base import api
 from .message import NCAPIMessage
 
 
@@ -8,7 +9,8 @@ class NCAPIGroup(NCAPIMessage):
 
     abc = False
 
-    async def send_group_message(
+    @api("send_group_msg")
+    def send_group_message(
         self,
         group_id: Union[str, int],
         message: List[dict],
@@ -20,27 +22,23 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "send_group_msg",
-            {
-                "group_id": group_id,
-                "message": message,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "message": message,
+        }
 
-    async def get_group_list(
+    @api("get_group_list")
+    def get_group_list(
         self,
     ) -> Any:
         """获取群组列表
         Returns:
             API响应数据
         """
-        return (
-            "get_group_list",
-            {},
-        )
+        return {}
 
-    async def get_group_info(
+    @api("get_group_info")
+    def get_group_info(
         self,
         group_id: int,
     ) -> Any:
@@ -50,14 +48,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_info",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def set_group_kick(
+    @api("set_group_kick")
+    def set_group_kick(
         self,
         group_id: Union[int, str],
         user_id: Union[int, str],
@@ -71,16 +67,14 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_group_kick",
-            {
-                "group_id": group_id,
-                "user_id": user_id,
-                "reject_add_request": reject_add_request,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "user_id": user_id,
+            "reject_add_request": reject_add_request,
+        }
 
-    async def set_group_ban(
+    @api("set_group_ban")
+    def set_group_ban(
         self,
         group_id: Union[int, str],
         user_id: Union[int, str],
@@ -94,16 +88,14 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_group_ban",
-            {
-                "group_id": group_id,
-                "user_id": user_id,
-                "duration": duration,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "user_id": user_id,
+            "duration": duration,
+        }
 
-    async def get_group_system_msg(
+    @api("get_group_system_msg")
+    def get_group_system_msg(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -113,14 +105,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_system_msg",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def get_essence_msg_list(
+    @api("get_essence_msg_list")
+    def get_essence_msg_list(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -130,14 +120,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_essence_msg_list",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def set_group_whole_ban(
+    @api("set_group_whole_ban")
+    def set_group_whole_ban(
         self,
         group_id: Union[int, str],
         enable: bool,
@@ -149,15 +137,13 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_group_whole_ban",
-            {
-                "group_id": group_id,
-                "enable": enable,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "enable": enable,
+        }
 
-    async def set_group_portrait(
+    @api("set_group_portrait")
+    def set_group_portrait(
         self,
         group_id: Union[int, str],
         file: str,
@@ -169,15 +155,13 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_group_portrait",
-            {
-                "group_id": group_id,
-                "file": file,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "file": file,
+        }
 
-    async def set_group_admin(
+    @api("set_group_admin")
+    def set_group_admin(
         self,
         group_id: Union[int, str],
         user_id: Union[int, str],
@@ -191,16 +175,14 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_group_admin",
-            {
-                "group_id": group_id,
-                "user_id": user_id,
-                "enable": enable,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "user_id": user_id,
+            "enable": enable,
+        }
 
-    async def set_essence_msg(
+    @api("set_essence_msg")
+    def set_essence_msg(
         self,
         message_id: Union[int, str],
     ) -> Any:
@@ -210,14 +192,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_essence_msg",
-            {
-                "message_id": message_id,
-            },
-        )
+        return {
+            "message_id": message_id,
+        }
 
-    async def set_group_card(
+    @api("set_group_card")
+    def set_group_card(
         self,
         group_id: Union[int, str],
         user_id: Union[int, str],
@@ -231,16 +211,14 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_group_card",
-            {
-                "group_id": group_id,
-                "user_id": user_id,
-                "card": card,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "user_id": user_id,
+            "card": card,
+        }
 
-    async def delete_essence_msg(
+    @api("delete_essence_msg")
+    def delete_essence_msg(
         self,
         message_id: Union[int, str],
     ) -> Any:
@@ -250,14 +228,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "delete_essence_msg",
-            {
-                "message_id": message_id,
-            },
-        )
+        return {
+            "message_id": message_id,
+        }
 
-    async def set_group_name(
+    @api("set_group_name")
+    def set_group_name(
         self,
         group_id: Union[int, str],
         group_name: str,
@@ -269,15 +245,13 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_group_name",
-            {
-                "group_id": group_id,
-                "group_name": group_name,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "group_name": group_name,
+        }
 
-    async def set_group_leave(
+    @api("set_group_leave")
+    def set_group_leave(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -287,14 +261,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_group_leave",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def send_group_notice(
+    @api("_send_group_notice")
+    def send_group_notice(
         self,
         group_id: Union[int, str],
         content: str,
@@ -309,24 +281,19 @@ class NCAPIGroup(NCAPIMessage):
             API响应数据
         """
         if image:
-            return (
-                "_send_group_notice",
-                {
-                    "group_id": group_id,
-                    "content": content,
-                    "image": image,
-                },
-            )
+            return {
+                "group_id": group_id,
+                "content": content,
+                "image": image,
+            }
         else:
-            return (
-                "_send_group_notice",
-                {
-                    "group_id": group_id,
-                    "content": content,
-                },
-            )
+            return {
+                "group_id": group_id,
+                "content": content,
+            }
 
-    async def get_group_notice(
+    @api("_get_group_notice")
+    def get_group_notice(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -336,14 +303,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "_get_group_notice",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def set_group_special_title(
+    @api("set_group_special_title")
+    def set_group_special_title(
         self,
         group_id: Union[int, str],
         user_id: Union[int, str],
@@ -357,16 +322,14 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_group_special_title",
-            {
-                "group_id": group_id,
-                "user_id": user_id,
-                "special_title": special_title,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "user_id": user_id,
+            "special_title": special_title,
+        }
 
-    async def upload_group_file(
+    @api("upload_group_file")
+    def upload_group_file(
         self,
         group_id: Union[int, str],
         file: str,
@@ -382,17 +345,15 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "upload_group_file",
-            {
-                "group_id": group_id,
-                "file": file,
-                "name": name,
-                "folder_id": folder_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "file": file,
+            "name": name,
+            "folder_id": folder_id,
+        }
 
-    async def set_group_add_request(
+    @api("set_group_add_request")
+    def set_group_add_request(
         self,
         flag: str,
         approve: bool,
@@ -407,24 +368,19 @@ class NCAPIGroup(NCAPIMessage):
             API响应数据
         """
         if approve:
-            return (
-                "set_group_add_request",
-                {
-                    "flag": flag,
-                    "approve": approve,
-                },
-            )
+            return {
+                "flag": flag,
+                "approve": approve,
+            }
         else:
-            return (
-                "set_group_add_request",
-                {
-                    "flag": flag,
-                    "approve": approve,
-                    "reason": reason,
-                },
-            )
+            return {
+                "flag": flag,
+                "approve": approve,
+                "reason": reason,
+            }
 
-    async def get_group_info_ex(
+    @api("get_group_info_ex")
+    def get_group_info_ex(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -434,14 +390,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_info_ex",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def create_group_file_folder(
+    @api("create_group_file_folder")
+    def create_group_file_folder(
         self,
         group_id: Union[int, str],
         folder_name: str,
@@ -453,15 +407,13 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "create_group_file_folder",
-            {
-                "group_id": group_id,
-                "folder_name": folder_name,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "folder_name": folder_name,
+        }
 
-    async def delete_group_file(
+    @api("delete_group_file")
+    def delete_group_file(
         self,
         group_id: Union[int, str],
         file_id: str,
@@ -473,15 +425,13 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "delete_group_file",
-            {
-                "group_id": group_id,
-                "file_id": file_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "file_id": file_id,
+        }
 
-    async def delete_group_folder(
+    @api("delete_group_folder")
+    def delete_group_folder(
         self,
         group_id: Union[int, str],
         folder_id: str,
@@ -493,15 +443,13 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "delete_group_folder",
-            {
-                "group_id": group_id,
-                "folder_id": folder_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "folder_id": folder_id,
+        }
 
-    async def get_group_file_system_info(
+    @api("get_group_file_system_info")
+    def get_group_file_system_info(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -511,14 +459,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_file_system_info",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def get_group_root_files(
+    @api("get_group_root_files")
+    def get_group_root_files(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -528,14 +474,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_root_files",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def get_group_files_by_folder(
+    @api("get_group_files_by_folder")
+    def get_group_files_by_folder(
         self,
         group_id: Union[int, str],
         folder_id: str,
@@ -549,16 +493,14 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_files_by_folder",
-            {
-                "group_id": group_id,
-                "folder_id": folder_id,
-                "file_count": file_count,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "folder_id": folder_id,
+            "file_count": file_count,
+        }
 
-    async def get_group_file_url(
+    @api("get_group_file_url")
+    def get_group_file_url(
         self,
         group_id: Union[int, str],
         file_id: str,
@@ -570,15 +512,13 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_file_url",
-            {
-                "group_id": group_id,
-                "file_id": file_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "file_id": file_id,
+        }
 
-    async def get_group_member_info(
+    @api("get_group_member_info")
+    def get_group_member_info(
         self,
         group_id: Union[int, str],
         user_id: Union[int, str],
@@ -592,16 +532,14 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_member_info",
-            {
-                "group_id": group_id,
-                "user_id": user_id,
-                "no_cache": no_cache,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "user_id": user_id,
+            "no_cache": no_cache,
+        }
 
-    async def get_group_member_list(
+    @api("get_group_member_list")
+    def get_group_member_list(
         self,
         group_id: Union[int, str],
         no_cache: bool = False,
@@ -613,15 +551,13 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_member_list",
-            {
-                "group_id": group_id,
-                "no_cache": no_cache,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "no_cache": no_cache,
+        }
 
-    async def get_group_honor_info(
+    @api("get_group_honor_info")
+    def get_group_honor_info(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -631,14 +567,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_honor_info",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def get_group_at_all_remain(
+    @api("get_group_at_all_remain")
+    def get_group_at_all_remain(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -648,14 +582,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_at_all_remain",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def get_group_ignored_notifies(
+    @api("get_group_ignored_notifies")
+    def get_group_ignored_notifies(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -665,14 +597,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_ignored_notifies",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def set_group_sign(
+    @api("set_group_sign")
+    def set_group_sign(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -682,14 +612,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_group_sign",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def send_group_sign(
+    @api("send_group_sign")
+    def send_group_sign(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -699,14 +627,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "send_group_sign",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def get_ai_characters(
+    @api("get_ai_characters")
+    def get_ai_characters(
         self,
         group_id: Union[int, str],
         chat_type: Union[int, str],
@@ -718,15 +644,13 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_ai_characters",
-            {
-                "group_id": group_id,
-                "chat_type": chat_type,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "chat_type": chat_type,
+        }
 
-    async def send_group_ai_record(
+    @api("send_group_ai_record")
+    def send_group_ai_record(
         self,
         group_id: Union[int, str],
         character: str,
@@ -740,16 +664,14 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "send_group_ai_record",
-            {
-                "group_id": group_id,
-                "character": character,
-                "text": text,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "character": character,
+            "text": text,
+        }
 
-    async def get_ai_record(
+    @api("get_ai_record")
+    def get_ai_record(
         self,
         group_id: Union[int, str],
         character: str,
@@ -763,16 +685,14 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_ai_record",
-            {
-                "group_id": group_id,
-                "character": character,
-                "text": text,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "character": character,
+            "text": text,
+        }
 
-    async def forward_group_single_msg(
+    @api("forward_group_single_msg")
+    def forward_group_single_msg(
         self,
         message_id: str,
         group_id: Union[int, str],
@@ -784,15 +704,13 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "forward_group_single_msg",
-            {
-                "group_id": group_id,
-                "message_id": message_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "message_id": message_id,
+        }
 
-    async def send_group_forward_msg(
+    @api("send_private_forward_msg")
+    def send_group_forward_msg(
         self,
         group_id: Union[int, str],
         messages: str,
@@ -807,15 +725,13 @@ class NCAPIGroup(NCAPIMessage):
         if len(messages) == 0:
             return None
 
-        return (
-            "send_private_forward_msg",
-            {
-                "messages": "这里应当放个消息段",
-                "group_id": group_id,
-            },
-        )
+        return {
+            "messages": "这里应当放个消息段",
+            "group_id": group_id,
+        }
 
-    async def get_group_shut_list(
+    @api("get_group_shut_list")
+    def get_group_shut_list(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -825,14 +741,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_shut_list",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def del_group_notice(
+    @api("_del_group_notice")
+    def del_group_notice(
         self,
         group_id: Union[int, str],
         notice_id: str,
@@ -844,15 +758,13 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "_del_group_notice",
-            {
-                "group_id": group_id,
-                "notice_id": notice_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "notice_id": notice_id,
+        }
 
-    async def mark_group_msg_as_read(
+    @api("mark_group_msg_as_read")
+    def mark_group_msg_as_read(
         self,
         group_id: Union[int, str],
     ) -> Any:
@@ -862,14 +774,12 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "mark_group_msg_as_read",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def get_group_msg_history(
+    @api("get_group_msg_history")
+    def get_group_msg_history(
         self,
         group_id: Union[int, str],
         message_seq: Union[int, str],
@@ -885,17 +795,15 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_group_msg_history",
-            {
-                "group_id": group_id,
-                "message_seq": message_seq,
-                "count": count,
-                "reverseOrder": reverse_order,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "message_seq": message_seq,
+            "count": count,
+            "reverseOrder": reverse_order,
+        }
 
-    async def set_group_remark(
+    @api("set_group_remark")
+    def set_group_remark(
         self,
         group_id: Union[int, str],
         remark: str,
@@ -907,10 +815,7 @@ class NCAPIGroup(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_group_remark",
-            {
-                "group_id": group_id,
-                "remark": remark,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "remark": remark,
+        }
@@ -1,5 +1,6 @@
-from typing import Any, Union
+from typing import Any, Optional, Union
 
+from ....abc.api_base import api
 from .api_base import NCAPIBase
 
 
@@ -8,7 +9,8 @@ class NCAPIMessage(NCAPIBase):
 
     abc = False
 
-    async def delete_msg(
+    @api("delete_msg")
+    def delete_msg(
         self,
         message_id: Union[int, str],
     ) -> Any:
@@ -18,14 +20,12 @@ class NCAPIMessage(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "delete_msg",
-            {
-                "message_id": message_id,
-            },
-        )
-
-    async def get_msg(
+        return {
+            "message_id": message_id,
+        }
+
+    @api("get_msg")
+    def get_msg(
         self,
         message_id: Union[int, str],
     ) -> Any:
@@ -35,14 +35,12 @@ class NCAPIMessage(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "get_msg",
-            {
-                "message_id": message_id,
-            },
-        )
-
-    async def get_image(
+        return {
+            "message_id": message_id,
+        }
+
+    @api("get_image")
+    def get_image(
         self,
         image_id: str,
     ) -> Any:
@@ -52,14 +50,12 @@ class NCAPIMessage(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "get_image",
-            {
-                "file_id": image_id,
-            },
-        )
-
-    async def get_record(
+        return {
+            "file_id": image_id,
+        }
+
+    @api("get_record")
+    def get_record(
         self,
         record_id: str,
         output_type: str = "mp3",
@@ -71,15 +67,13 @@ class NCAPIMessage(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "get_record",
-            {
-                "file_id": record_id,
-                "out_format": output_type,
-            },
-        )
-
-    async def get_file(
+        return {
+            "file_id": record_id,
+            "out_format": output_type,
+        }
+
+    @api("get_file")
+    def get_file(
         self,
         file_id: str,
     ) -> Any:
@@ -89,14 +83,12 @@ class NCAPIMessage(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "get_file",
-            {
-                "file_id": file_id,
-            },
-        )
-
-    async def set_msg_emoji_like(
+        return {
+            "file_id": file_id,
+        }
+
+    @api("set_msg_emoji_like")
+    def set_msg_emoji_like(
         self,
         message_id: Union[int, str],
         emoji_id: str,
@@ -110,23 +102,21 @@ class NCAPIMessage(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "set_msg_emoji_like",
-            {
-                "message_id": message_id,
-                "emoji_id": emoji_id,
-                "set": emoji_set,
-            },
-        )
-
-    async def fetch_emoji_like(
+        return {
+            "message_id": message_id,
+            "emoji_id": emoji_id,
+            "set": emoji_set,
+        }
+
+    @api("fetch_emoji_like")
+    def fetch_emoji_like(
         self,
         message_id: Union[int, str],
         emoji_id: str,
         emoji_type: str,
-        group_id: Union[int, str] = None,
-        user_id: Union[int, str] = None,
-        count: int = None,
+        group_id: Optional[Union[int, str]] = None,
+        user_id: Optional[Union[int, str]] = None,
+        count: Optional[int] = None,
     ) -> Any:
         """获取贴表情详情
         Args:
@@ -144,18 +134,17 @@ class NCAPIMessage(NCAPIBase):
             "emojiId": emoji_id,
             "emojiType": emoji_type,
         }
-        if group_id:
+        # 用 is not None 判断，0 也是合法值
+        if group_id is not None:
             params["group_id"] = group_id
-        elif user_id:
+        elif user_id is not None:
             params["user_id"] = user_id
-        if count:
+        if count is not None:
             params["count"] = count
-        return (
-            "fetch_emoji_like",
-            params,
-        )
+        return params
 
-    async def get_forward_msg(
+    @api("get_forward_msg")
+    def get_forward_msg(
         self,
         message_id: str,
     ) -> Any:
@@ -165,17 +154,15 @@ class NCAPIMessage(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "get_forward_msg",
-            {
-                "message_id": message_id,
-            },
-        )
-
-    async def send_poke(
+        return {
+            "message_id": message_id,
+        }
+
+    @api("send_poke")
+    def send_poke(
         self,
         user_id: Union[int, str],
-        group_id: Union[int, str] = None,
+        group_id: Optional[Union[int, str]] = None,
     ) -> Any:
         """发送戳一戳
         Args:
@@ -185,14 +172,12 @@ class NCAPIMessage(NCAPIBase):
             API响应数据
         """
         params = {"user_id": user_id}
-        if group_id:
+        if group_id is not None:
             params["group_id"] = group_id
-        return (
-            "send_poke",
-            params,
-        )
+        return params
 
-    async def forward_friend_single_msg(
+    @api("forward_friend_single_msg")
+    def forward_friend_single_msg(
         self,
         message_id: str,
         user_id: Union[int, str],
@@ -204,15 +189,13 @@ class NCAPIMessage(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "forward_friend_single_msg",
-            {
-                "user_id": user_id,
-                "message_id": message_id,
-            },
-        )
-
-    async def send_private_forward_msg(
+        return {
+            "user_id": user_id,
+            "message_id": message_id,
+        }
+
+    @api("send_private_forward_msg")
+    def send_private_forward_msg(
         self,
         user_id: Union[int, str],
         messages: dict,
@@ -227,10 +210,7 @@ class NCAPIMessage(NCAPIBase):
         if len(messages) == 0:
             return None
 
-        return (
-            "send_private_forward_msg",
-            {
-                "messages": messages,
-                "user_id": user_id,
-            },
-        )
+        return {
+            "messages": messages,
+            "user_id": user_id,
+        }
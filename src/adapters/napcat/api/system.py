@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional, Union
 
+from ....abc.api_base import api
 from .api_base import NCAPIBase
 
 
@@ -8,6 +9,7 @@ class NCAPISystem(NCAPIBase):
 
     abc = False
 
+    @api("get_clientkey")
     def get_client_key(
         self,
     ) -> Any:
@@ -15,24 +17,20 @@ class NCAPISystem(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "get_clientkey",
-            {},
-        )
+        return {}
 
-    async def get_robot_uin_range(
+    @api("get_robot_uin_range")
+    def get_robot_uin_range(
         self,
     ) -> Any:
         """获取机器人 QQ 号范围
         Returns:
             API响应数据
         """
-        return (
-            "get_robot_uin_range",
-            {},
-        )
+        return {}
 
-    async def ocr_image(
+    @api("ocr_image")
+    def ocr_image(
         self,
         image: str,
     ) -> Any:
@@ -42,14 +40,12 @@ class NCAPISystem(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "ocr_image",
-            {
-                "image": image,
-            },
-        )
+        return {
+            "image": image,
+        }
 
-    async def ocr_image_new(
+    @api(".ocr_image")
+    def ocr_image_new(
         self,
         image: str,
     ) -> Any:
@@ -59,14 +55,12 @@ class NCAPISystem(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            ".ocr_image",
-            {
-                "image": image,
-            },
-        )
+        return {
+            "image": image,
+        }
 
-    async def translate_en2zh(
+    @api("translate_en2zh")
+    def translate_en2zh(
         self,
         words: List[str],
     ) -> Any:
@@ -76,26 +70,22 @@ class NCAPISystem(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "translate_en2zh",
-            {
-                "words": words,
-            },
-        )
+        return {
+            "words": words,
+        }
 
-    async def get_login_info(
+    @api("get_login_info")
+    def get_login_info(
         self,
     ) -> Any:
         """获取登录信息
         Returns:
             API响应数据
         """
-        return (
-            "get_login_info",
-            {},
-        )
+        return {}
 
-    async def set_input_status(
+    @api("set_input_status")
+    def set_input_status(
         self,
         event_type: int,
         user_id: Union[int, str],
@@ -107,15 +97,13 @@ class NCAPISystem(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "set_input_status",
-            {
-                "eventType": event_type,
-                "user_id": user_id,
-            },
-        )
+        return {
+            "eventType": event_type,
+            "user_id": user_id,
+        }
 
-    async def download_file(
+    @api("download_file")
+    def download_file(
         self,
         thread_count: int,
         headers: Union[Dict, str],
@@ -145,12 +133,10 @@ class NCAPISystem(NCAPIBase):
             params["url"] = url
             if name:
                 params["name"] = name
-        return (
-            "download_file",
-            params,
-        )
+        return params
 
-    async def get_cookies(
+    @api("get_cookies")
+    def get_cookies(
         self,
         domain: str,
     ) -> Any:
@@ -160,14 +146,12 @@ class NCAPISystem(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "get_cookies",
-            {
-                "domain": domain,
-            },
-        )
+        return {
+            "domain": domain,
+        }
 
-    async def handle_quick_operation(
+    @api(".handle_quick_operation")
+    def handle_quick_operation(
         self,
         context: Dict,
         operation: Dict,
@@ -179,27 +163,23 @@ class NCAPISystem(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            ".handle_quick_operation",
-            {
-                "context": context,
-                "operation": operation,
-            },
-        )
+        return {
+            "context": context,
+            "operation": operation,
+        }
 
-    async def get_csrf_token(
+    @api("get_csrf_token")
+    def get_csrf_token(
         self,
     ) -> Any:
         """获取 CSRF Token
         Returns:
             API响应数据
         """
-        return (
-            "get_csrf_token",
-            {},
-        )
+        return {}
 
-    async def get_credentials(
+    @api("get_credentials")
+    def get_credentials(
         self,
         domain: str,
     ) -> Any:
@@ -209,14 +189,12 @@ class NCAPISystem(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "get_credentials",
-            {
-                "domain": domain,
-            },
-        )
+        return {
+            "domain": domain,
+        }
 
-    async def get_model_show(
+    @api("_get_model_show")
+    def get_model_show(
         self,
         model: str,
     ) -> Any:
@@ -226,98 +204,82 @@ class NCAPISystem(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "_get_model_show",
-            {
-                "model": model,
-            },
-        )
+        return {
+            "model": model,
+        }
 
-    async def can_send_image(
+    @api("can_send_image")
+    def can_send_image(
         self,
     ) -> Any:
         """检查是否可以发送图片
         Returns:
             API响应数据
         """
-        return (
-            "can_send_image",
-            {},
-        )
+        return {}
 
-    async def nc_get_packet_status(
+    @api("nc_get_packet_status")
+    def nc_get_packet_status(
         self,
     ) -> Any:
         """获取 packet 状态
         Returns:
             API响应数据
         """
-        return (
-            "nc_get_packet_status",
-            {},
-        )
+        return {}
 
-    async def can_send_record(
+    @api("can_send_record")
+    def can_send_record(
         self,
     ) -> Any:
         """检查是否可以发送语音
         Returns:
             API响应数据
         """
-        return (
-            "can_send_record",
-            {},
-        )
+        return {}
 
-    async def get_status(
+    @api("get_status")
+    def get_status(
         self,
     ) -> Any:
         """获取状态
         Returns:
             API响应数据
         """
-        return (
-            "get_status",
-            {},
-        )
+        return {}
 
-    async def nc_get_rkey(
+    @api("nc_get_rkey")
+    def nc_get_rkey(
         self,
     ) -> Any:
         """获取 rkey
         Returns:
             API响应数据
         """
-        return (
-            "nc_get_rkey",
-            {},
-        )
+        return {}
 
-    async def get_version_info(
+    @api("get_version_info")
+    def get_version_info(
         self,
     ) -> Any:
         """获取版本信息
         Returns:
             API响应数据
         """
-        return (
-            "get_version_info",
-            {},
-        )
+        return {}
 
-    async def mark_all_as_read(
+    @api("_mark_all_as_read")
+    def mark_all_as_read(
         self,
     ) -> Any:
         """设置所有消息已读
         Returns:
             API响应数据
         """
-        return (
-            "_mark_all_as_read",
-            {},
-        )
+        return {}
 
-    async def get_recent_contact(
+    @api("get_recent_contact")
+    def get_recent_contact(
         self,
         count: int,
     ) -> Any:
@@ -330,9 +292,6 @@ class NCAPISystem(NCAPIBase):
         Returns:
             API响应数据
         """
-        return (
-            "get_recent_contact",
-            {
-                "count": count,
-            },
-        )
+        return {
+            "count": count,
+        }
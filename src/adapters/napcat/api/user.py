@@ -1,5 +1,6 @@
 from typing import Any, List, Union
 
+from ....abc.api_base import api
 from .message import NCAPIMessage
 
 
@@ -8,7 +9,8 @@ class NCAPIUser(NCAPIMessage):
 
     abc = False
 
-    async def send_private_msg(
+    @api("send_private_msg")
+    def send_private_msg(
         self,
         user_id: Union[str, int],
         message: List[dict],
@@ -20,15 +22,13 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "send_private_msg",
-            {
-                "user_id": user_id,
-                "message": message,
-            },
-        )
+        return {
+            "user_id": user_id,
+            "message": message,
+        }
 
-    async def set_qq_profile(
+    @api("set_qq_profile")
+    def set_qq_profile(
         self,
         nickname: str,
         personal_note: str,
@@ -42,16 +42,14 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_qq_profile",
-            {
-                "nickname": nickname,
-                "personal_note": personal_note,
-                "sex": sex,
-            },
-        )
+        return {
+            "nickname": nickname,
+            "personal_note": personal_note,
+            "sex": sex,
+        }
 
-    async def get_user_card(
+    @api("ArkSharePeer")
+    def get_user_card(
         self,
         user_id: str,
         phone_number: str,
@@ -63,15 +61,13 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "ArkSharePeer",
-            {
-                "user_id": user_id,
-                "phoneNumber": phone_number,
-            },
-        )
+        return {
+            "user_id": user_id,
+            "phoneNumber": phone_number,
+        }
 
-    async def get_group_card(
+    @api("ArkSharePeer")
+    def get_group_card(
         self,
         group_id: str,
         phone_number: str,
@@ -83,15 +79,13 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "ArkSharePeer",
-            {
-                "group_id": group_id,
-                "phoneNumber": phone_number,
-            },
-        )
+        return {
+            "group_id": group_id,
+            "phoneNumber": phone_number,
+        }
 
-    async def get_share_group_card(
+    @api("ArkShareGroup")
+    def get_share_group_card(
         self,
         group_id: str,
     ) -> Any:
@@ -101,14 +95,12 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "ArkShareGroup",
-            {
-                "group_id": group_id,
-            },
-        )
+        return {
+            "group_id": group_id,
+        }
 
-    async def set_online_status(
+    @api("set_online_status")
+    def set_online_status(
         self,
         status: str,
     ) -> Any:
@@ -118,26 +110,22 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_online_status",
-            {
-                "status": status,
-            },
-        )
+        return {
+            "status": status,
+        }
 
-    async def get_friends_with_category(
+    @api("get_friends_with_category")
+    def get_friends_with_category(
         self,
     ) -> Any:
         """获取好友列表
         Returns:
             API响应数据
         """
-        return (
-            "get_friends_with_category",
-            {},
-        )
+        return {}
 
-    async def set_qq_avatar(
+    @api("set_qq_avatar")
+    def set_qq_avatar(
         self,
         avatar: str,
     ) -> Any:
@@ -147,14 +135,12 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_qq_avatar",
-            {
-                "file": avatar,
-            },
-        )
+        return {
+            "file": avatar,
+        }
 
-    async def send_like(
+    @api("send_like")
+    def send_like(
         self,
         user_id: str,
         times: int,
@@ -166,15 +152,13 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "send_like",
-            {
-                "user_id": user_id,
-                "times": times,
-            },
-        )
+        return {
+            "user_id": user_id,
+            "times": times,
+        }
 
-    async def create_collection(
+    @api("create_collection")
+    def create_collection(
         self,
         rawdata: str,
         brief: str,
@@ -186,15 +170,13 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "create_collection",
-            {
-                "rawData": rawdata,
-                "brief": brief,
-            },
-        )
+        return {
+            "rawData": rawdata,
+            "brief": brief,
+        }
 
-    async def set_friend_add_request(
+    @api("set_friend_add_request")
+    def set_friend_add_request(
         self,
         flag: str,
         approve: bool,
@@ -208,16 +190,14 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_friend_add_request",
-            {
-                "flag": flag,
-                "approve": approve,
-                "remark": remark,
-            },
-        )
+        return {
+            "flag": flag,
+            "approve": approve,
+            "remark": remark,
+        }
 
-    async def set_self_long_nick(
+    @api("set_self_longnick")
+    def set_self_long_nick(
         self,
         longnick: str,
     ) -> Any:
@@ -227,14 +207,12 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_self_longnick",
-            {
-                "longNick": longnick,
-            },
-        )
+        return {
+            "longNick": longnick,
+        }
 
-    async def get_stranger_info(
+    @api("get_stranger_info")
+    def get_stranger_info(
         self,
         user_id: Union[int, str],
     ) -> Any:
@@ -246,14 +224,12 @@ class NCAPIUser(NCAPIMessage):
         """
         if not user_id:
             pass
-        return (
-            "get_stranger_info",
-            {
-                "user_id": user_id,
-            },
-        )
+        return {
+            "user_id": user_id,
+        }
 
-    async def get_friend_list(
+    @api("get_friend_list")
+    def get_friend_list(
         self,
         cache: bool = False,
     ) -> Any:
@@ -263,26 +239,22 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_friend_list",
-            {
-                "no_cache": cache,
-            },
-        )
+        return {
+            "no_cache": cache,
+        }
 
-    async def get_profile_like(
+    @api("get_profile_like")
+    def get_profile_like(
         self,
     ) -> Any:
         """获取个人资料卡点赞数
         Returns:
             API响应数据
         """
-        return (
-            "get_profile_like",
-            {},
-        )
+        return {}
 
-    async def fetch_custom_face(
+    @api("fetch_custom_face")
+    def fetch_custom_face(
         self,
         count: int,
     ) -> Any:
@@ -292,14 +264,12 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "fetch_custom_face",
-            {
-                "count": count,
-            },
-        )
+        return {
+            "count": count,
+        }
 
-    async def upload_private_file(
+    @api("upload_private_file")
+    def upload_private_file(
         self,
         user_id: Union[int, str],
         file: str,
@@ -313,16 +283,14 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "upload_private_file",
-            {
-                "user_id": user_id,
-                "file": file,
-                "name": name,
-            },
-        )
+        return {
+            "user_id": user_id,
+            "file": file,
+            "name": name,
+        }
 
-    async def delete_friend(
+    @api("delete_friend")
+    def delete_friend(
         self,
         user_id: Union[int, str],
         friend_id: Union[int, str],
@@ -338,17 +306,15 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "delete_friend",
-            {
-                "user_id": user_id,
-                "friend_id": friend_id,
-                "temp_block": temp_block,
-                "temp_both_del": temp_both_del,
-            },
-        )
+        return {
+            "user_id": user_id,
+            "friend_id": friend_id,
+            "temp_block": temp_block,
+            "temp_both_del": temp_both_del,
+        }
 
-    async def nc_get_user_status(
+    @api("nc_get_user_status")
+    def nc_get_user_status(
         self,
         user_id: Union[int, str],
     ) -> Any:
@@ -358,14 +324,12 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "nc_get_user_status",
-            {
-                "user_id": user_id,
-            },
-        )
+        return {
+            "user_id": user_id,
+        }
 
-    async def get_mini_app_ark(
+    @api("get_mini_app_ark")
+    def get_mini_app_ark(
         self,
         app_json: dict,
     ) -> Any:
@@ -375,12 +339,10 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_mini_app_ark",
-            app_json,
-        )
+        return app_json
 
-    async def mark_private_msg_as_read(
+    @api("mark_private_msg_as_read")
+    def mark_private_msg_as_read(
         self,
         user_id: Union[int, str],
     ) -> Any:
@@ -390,14 +352,12 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "mark_private_msg_as_read",
-            {
-                "user_id": user_id,
-            },
-        )
+        return {
+            "user_id": user_id,
+        }
 
-    async def get_friend_msg_history(
+    @api("get_friend_msg_history")
+    def get_friend_msg_history(
         self,
         user_id: Union[int, str],
         message_seq: Union[int, str],
@@ -413,17 +373,15 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "get_friend_msg_history",
-            {
-                "user_id": user_id,
-                "message_seq": message_seq,
-                "count": count,
-                "reverseOrder": reverse_order,
-            },
-        )
+        return {
+            "user_id": user_id,
+            "message_seq": message_seq,
+            "count": count,
+            "reverseOrder": reverse_order,
+        }
 
-    async def set_friend_remark(
+    @api("set_friend_remark")
+    def set_friend_remark(
         self,
         user_id: Union[int, str],
         remark: str,
@@ -435,10 +393,7 @@ class NCAPIUser(NCAPIMessage):
         Returns:
             API响应数据
         """
-        return (
-            "set_friend_remark",
-            {
-                "user_id": user_id,
-                "remark": remark,
-            },
-        )
+        return {
+            "user_id": user_id,
+            "remark": remark,
+        }
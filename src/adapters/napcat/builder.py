@@ -40,6 +40,8 @@ class MessageBuilder:
     支持链式调用和批量操作
     """
 
+    __slots__ = ("_nodes", "_current_chain")
+
     def __init__(self):
         self._nodes: List[Union[str, Any]] = []
         self._current_chain: Optional[MessageChain] = None
@@ -70,7 +72,7 @@ class MessageBuilder:
         Returns:
             MessageBuilder实例，支持链式调用
         """
-        self._nodes.append(Face(id=str(face_id), face_text=face_text))
+        self._nodes.append(Face(id=face_id, face_text=face_text))
         return self
 
     def at(self, user_id: Union[str, int], all: bool = False) -> "MessageBuilder":
@@ -86,7 +88,7 @@ class MessageBuilder:
         if all:
             self._nodes.append(AtAll())
         else:
-            self._nodes.append(At(qq=str(user_id)))
+            self._nodes.append(At(qq=user_id))
         return self
 
     # ==================== 媒体消息方法 ====================
@@ -371,7 +373,7 @@ class MessageBuilder:
         Returns:
             MessageBuilder实例，支持链式调用
         """
-        self._nodes.append(Reply(id=str(message_id)))
+        self._nodes.append(Reply(id=message_id))
         if text:
             self._nodes.append(text)
         return self
@@ -402,9 +404,7 @@ class MessageBuilder:
         Returns:
             MessageBuilder实例，支持链式调用
         """
-        self._nodes.append(
-            Node(user_id=str(user_id), nickname=nickname, content=content)
-        )
+        self._nodes.append(Node(user_id=user_id, nickname=nickname, content=content))
         return self
 
     # ==================== 富文本方法 ====================
@@ -467,8 +467,7 @@ class MessageBuilder:
         Returns:
             MessageBuilder实例，支持链式调用
         """
-        for text in texts:
-            self.text(text)
+        self._nodes.extend(texts)
         return self
 
     def add_images(self, *image_urls: str) -> "MessageBuilder":
@@ -480,8 +479,8 @@ class MessageBuilder:
         Returns:
             MessageBuilder实例，支持链式调用
         """
-        for url in image_urls:
-            self.image(url=url)
+        # 一次 extend，列表只扩容一次
+        self._nodes.extend([Image(url=url) for url in image_urls])
         return self
 
     def add_ats(self, *user_ids: Union[str, int]) -> "MessageBuilder":
@@ -493,8 +492,7 @@ class MessageBuilder:
         Returns:
             MessageBuilder实例，支持链式调用
         """
-        for user_id in user_ids:
-            self.at(user_id)
+        self._nodes.extend([At(qq=user_id) for user_id in user_ids])
         return self
 
     # ==================== 构建和转换方法 ====================
@@ -505,7 +503,8 @@ class MessageBuilder:
         Returns:
             MessageChain实例
         """
-        self._current_chain = MessageChain(nodes=self._nodes.copy())
+        # MessageChain 会把节点转成 tuple，本身就是快照，无需先复制列表
+        self._current_chain = MessageChain(nodes=self._nodes)
         return self._current_chain
 
     def build_message(
@@ -539,11 +538,14 @@ class MessageBuilder:
             Napcat协议消息段列表
         """
         segments = []
+        append = segments.append
         for node in self._nodes:
-            if hasattr(node, "to_dict"):
-                segments.append(node.to_dict())
+            # 每个节点只查找一次 to_dict
+            to_dict = getattr(node, "to_dict", None)
+            if to_dict is not None:
+                append(to_dict())
             else:
-                segments.append({"type": "text", "data": {"text": str(node)}})
+                append({"type": "text", "data": {"text": str(node)}})
         return segments
 
     def clear(self) -> "MessageBuilder":
@@ -594,6 +596,7 @@ class MessageBuilder:
 
 
 # ==================== 快捷构建函数 ====================
+# 单次构建直接生成 MessageChain，不经过 MessageBuilder
 
 
 def build_text_message(text: str) -> MessageChain:
@@ -605,7 +608,7 @@ def build_text_message(text: str) -> MessageChain:
     Returns:
         MessageChain实例
     """
-    return MessageBuilder().text(text).build_chain()
+    return MessageChain(nodes=(text,))
 
 
 def build_image_message(image_url: str, text: Optional[str] = None) -> MessageChain:
@@ -618,10 +621,8 @@ def build_image_message(image_url: str, text: Optional[str] = None) -> MessageCh
     Returns:
         MessageChain实例
     """
-    builder = MessageBuilder()
-    if text:
-        builder.text(text)
-    return builder.image(url=image_url).build_chain()
+    image = Image(url=image_url)
+    return MessageChain(nodes=(text, image) if text else (image,))
 
 
 def build_at_message(
@@ -636,10 +637,8 @@ def build_at_message(
     Returns:
         MessageChain实例
     """
-    builder = MessageBuilder().at(user_id)
-    if text:
-        builder.text(text)
-    return builder.build_chain()
+    at = At(qq=user_id)
+    return MessageChain(nodes=(at, text) if text else (at,))
 
 
 def build_forward_message(messages: List[Dict[str, Any]]) -> MessageChain:
@@ -651,9 +650,11 @@ def build_forward_message(messages: List[Dict[str, Any]]) -> MessageChain:
     Returns:
         MessageChain实例
     """
-    builder = MessageBuilder()
-    for msg in messages:
-        builder.node(
-            user_id=msg["user_id"], nickname=msg["nickname"], content=msg["content"]
-        )
-    return builder.build_chain()
+    return MessageChain(
+        nodes=[
+            Node(
+                user_id=msg["user_id"], nickname=msg["nickname"], content=msg["content"]
+            )
+            for msg in messages
+        ]
+    )
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 
 from .node_base import BaseNode, NodeT
 
@@ -119,22 +119,29 @@ class AtAll(At):
         return "[@ALL]"
 
 
+class _EmptyNode(BaseNode):
+    """无数据字段的节点，to_dict 无需遍历实例属性"""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": self._node_type, "data": {}}
+
+
 @dataclass
-class Rps(BaseNode):
+class Rps(_EmptyNode):
     """猜拳消息节点"""
 
     _node_type: str = "rps"
 
 
 @dataclass
-class Dice(BaseNode):
+class Dice(_EmptyNode):
     """骰子消息节点"""
 
     _node_type: str = "dice"
 
 
 @dataclass
-class Shake(BaseNode):
+class Shake(_EmptyNode):
     """抖动消息节点"""
 
     _node_type: str = "shake"
@@ -153,7 +160,7 @@ class Poke(BaseNode):
 
 
 @dataclass
-class Anonymous(BaseNode):
+class Anonymous(_EmptyNode):
     """匿名消息节点"""
 
     _node_type: str = "anonymous"
@@ -1,4 +1,3 @@
-import asyncio
 import datetime as dt
 import json
 import logging
@@ -8,10 +7,12 @@ from ...abc.protocol_abc import ProtocolABC, RawGroup, RawMessage, RawUser
 from ...connector import AsyncWebSocketClient, MessageType
 from ...core.IM import Group, Message, MessageChain, MessageNodeT, User, UserInfo
 from ...plugins_system.core.events import Event
+from ...utils.json_compat import loads as json_loads
 from ...utils.logformat import LogFormats
 from ...utils.typec import GroupID, MsgId, UserID
 from .api import NCAPI
 from .builder import MessageBuilder
+from .nodes.node_base import BaseNode
 
 logger = logging.getLogger("Protocol.Napcat")
 
@@ -106,9 +107,8 @@ class NapcatProtocol(ProtocolABC):
 
         if not self.client.running:
             await self.client.start()
-            await asyncio.sleep(0.1)
-            while self.client.connection.is_connected():
-                await asyncio.sleep(0.1)
+            # 等待握手完成，不再轮询连接状态；重连失败或超时会抛出异常而不是一直挂起
+            await self.client.wait_connected(timeout=self.client.config.connect_timeout)
 
         return client
 
@@ -242,7 +242,8 @@ class NapcatProtocol(ProtocolABC):
 
         # 解析 JSON 数据
         try:
-            raw_dict: dict = json.loads(raw[0])
+            # 与 API 响应共用解析函数（可用时为 orjson）
+            raw_dict: dict = json_loads(raw[0])
             logger.debug("接收到原始数据: %s", raw_dict)
         except json.JSONDecodeError as e:
             logger.error("JSON 解析失败: %s", e)
@@ -290,18 +291,17 @@ class NapcatProtocol(ProtocolABC):
 
     def _content_to_segments(self, content: Message) -> List[dict]:
         """将 Message 转换为 napcat 消息段"""
-        from .nodes.node_base import BaseNode
-
         segments = []
+        append = segments.append
         nodes: list[MessageNodeT] = content.content
 
         for node in nodes:
             if isinstance(node, BaseNode):
                 # 所有BaseNode子类都支持to_dict，返回符合OneBot协议的格式
-                segments.append(node.to_dict())
+                append(node.to_dict())
             elif isinstance(node, str):
                 # 字符串直接转为text节点
-                segments.append({"type": "text", "data": {"text": node}})
+                append({"type": "text", "data": {"text": node}})
             else:
                 logger.warning("napcat协议未知消息节点: %s", node)
 
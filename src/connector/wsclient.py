@@ -8,7 +8,7 @@ import time
 import uuid
 from asyncio import QueueFull
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
 from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
@@ -54,6 +54,10 @@ class WebSocketConfig:
             raise ValueError("Reconnect attempts cannot be negative")
 
 
+# close() 放入队列的哨兵，用于唤醒正在等待的消费者
+_CLOSED = object()
+
+
 class WebSocketListener:
     """WebSocket 监听器"""
 
@@ -87,9 +91,9 @@ class WebSocketListener:
 
         try:
             if timeout is None:
-                return await self.queue.get()
+                item = await self.queue.get()
             else:
-                return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+                item = await asyncio.wait_for(self.queue.get(), timeout=timeout)
         except asyncio.CancelledError:
             raise
         except Exception as e:
@@ -97,6 +101,25 @@ class WebSocketListener:
                 raise ListenerClosedError(f"Listener {self.id} is closed") from e
             raise
 
+        if item is _CLOSED:
+            # 放回哨兵，留给其他等待者
+            self.queue.put_nowait(_CLOSED)
+            raise ListenerClosedError(f"Listener {self.id} is closed")
+        return item
+
+    async def get_batch(
+        self, max_batch: int, timeout: Optional[float] = None
+    ) -> List[Tuple[Any, MessageType]]:
+        """批量获取消息：阻塞等待第一条，随后非阻塞取走已就绪的消息（最多 max_batch 条）"""
+        batch = [await self.get(timeout)]
+        queue = self.queue
+        while len(batch) < max_batch:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
     def get_nowait(self) -> Optional[Tuple[Any, MessageType]]:
         """非阻塞获取消息"""
         if self._closed:
@@ -110,12 +133,17 @@ class WebSocketListener:
     def close(self):
         """关闭监听器"""
         self._closed = True
-        # 清空队列以释放等待的消费者
+        # 清空队列，再放入哨兵唤醒正在等待的消费者
         while not self.queue.empty():
             try:
                 self.queue.get_nowait()
             except asyncio.QueueEmpty:
                 break
+        self.queue.put_nowait(_CLOSED)
+
+    def qsize(self) -> int:
+        """当前积压的消息数"""
+        return self.queue.qsize()
 
     @property
     def is_closed(self) -> bool:
@@ -141,6 +169,8 @@ class AioHttpWebSocketConnection:
         self.websocket: Optional[ClientWebSocketResponse] = None
         self.session: Optional[ClientSession] = None
         self.state = WebSocketState.Disconnected
+        # 握手完成时置位，关闭时清除，等待方无需轮询 is_connected
+        self.connected = asyncio.Event()
 
         # 指标
         self.metrics = {
@@ -184,6 +214,7 @@ class AioHttpWebSocketConnection:
             )
 
             self.state = WebSocketState.CONNECTED
+            self.connected.set()
             self.metrics["successful_connections"] += 1
             self.logger.info(f"Connected to {self.config.uri}")
 
@@ -214,6 +245,7 @@ class AioHttpWebSocketConnection:
             return
 
         self.state = WebSocketState.Closing
+        self.connected.clear()
         self.logger.debug("Closing connection")
 
         try:
@@ -468,6 +500,36 @@ class AsyncWebSocketClient(ABCWebSocketClient):
 
         self.logger.info("WebSocket client stopped")
 
+    async def wait_connected(self, timeout: Optional[float] = None) -> None:
+        """等待连接握手完成
+
+        超时抛出 asyncio.TimeoutError；
+        主任务在连上之前结束（如重连失败）抛出 ConnectionError
+        """
+        connected = self.connection.connected
+        if connected.is_set():
+            return
+
+        main_task = self._main_task
+        if main_task is None or main_task.done():
+            raise ConnectionError("Client not running")
+
+        waiter = asyncio.create_task(connected.wait())
+        try:
+            done, _ = await asyncio.wait(
+                (waiter, main_task),
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            waiter.cancel()
+
+        if connected.is_set():
+            return
+        if main_task in done:
+            raise ConnectionError("Client stopped before connecting")
+        raise asyncio.TimeoutError(f"Not connected within {timeout}s")
+
     async def create_listener(self, buffer_size: Optional[int] = None) -> ListenerId:
         """创建监听器"""
         if buffer_size is None:
@@ -506,6 +568,21 @@ class AsyncWebSocketClient(ABCWebSocketClient):
 
         return await listener.get(timeout)
 
+    async def get_messages_batch(
+        self,
+        listener_id: ListenerId,
+        max_batch: int = 64,
+        timeout: Optional[float] = None,
+    ) -> List[Tuple[Any, MessageType]]:
+        """从监听器批量获取消息（至少一条，异步阻塞）"""
+        with self._listeners_lock:
+            listener = self._listeners.get(listener_id)
+
+        if not listener:
+            raise ListenerEvictedError(f"Listener {listener_id} not found")
+
+        return await listener.get_batch(max_batch, timeout)
+
     def get_message_nowait(self, listener_id: str) -> Optional[Tuple[Any, MessageType]]:
         """非阻塞获取消息"""
         with self._listeners_lock:
@@ -570,6 +647,7 @@ class AsyncWebSocketClient(ABCWebSocketClient):
 
         with self._listeners_lock:
             active_listeners = len(self._listeners)
+            pending = {lid: lst.qsize() for lid, lst in self._listeners.items()}
 
         return {
             "connection": connection_metrics,
@@ -577,6 +655,7 @@ class AsyncWebSocketClient(ABCWebSocketClient):
             "listeners": {
                 "active": active_listeners,
                 "max": self.config.max_listeners,
+                "pending": pending,  # 各监听器积压的消息数
             },
             "running": self._running,
         }
@@ -644,10 +723,16 @@ class AsyncWebSocketClient(ABCWebSocketClient):
             if not self.connection.is_connected():
                 await asyncio.sleep(0.1)
                 continue
-            try:
-                message = await asyncio.wait_for(self._send_queue.get(), timeout=0.1)
-            except asyncio.TimeoutError:
-                continue
+            if self._send_queue.empty():
+                try:
+                    message = await asyncio.wait_for(
+                        self._send_queue.get(), timeout=0.1
+                    )
+                except asyncio.TimeoutError:
+                    continue
+            else:
+                # 突发时直接取已排队的消息连续写出，省去每条 wait_for 的计时器与任务
+                message = self._send_queue.get_nowait()
 
             try:
                 await self.connection.send(message)
@@ -847,11 +932,13 @@ if __name__ == "__main__":
 | 目标 | 异步用法 | 同步用法 | 备注 |
 |---|---|---|---|
 | 启动 | `async with client:` 或 `await client.start()` | `ws.start()` | 同步版启动后事件循环在后台线程跑 |
+| 等待连接 | `await client.wait_connected(timeout=10)` | - | 握手完成即返回，无需轮询 |
 | 发消息 | `await client.send(dict/text/bytes)` | `ws.send(...)` | 队列满抛 `WebSocketError` |
 | 收消息 | `await client.get_message(lid, timeout=10)` | `ws.get_message(lid, timeout=10)` | 超时抛 `asyncio.TimeoutError` |
+| 批量收 | `await client.get_messages_batch(lid, 64)` | - | 等到第一条后顺带取走已到达的消息 |
 | 非阻塞收 | `client._listeners[lid].get_nowait()` | `ws.get_message_nowait(lid)` | 无数据返回 None |
 | 关闭 | 自动 / `await client.stop()` | `ws.stop()` | 会等待内部任务结束，线程安全 |
-| 指标 | `client.get_metrics()` | `ws.get_metrics()` | 实时 Dict，含连接、重连、监听器数量 |
+| 指标 | `client.get_metrics()` | `ws.get_metrics()` | 实时 Dict，含连接、重连、监听器数量与积压 |
 
 ------------------------------------------------
 ## 踩坑提示
@@ -220,8 +220,12 @@ class IMClient(Generic[APIBaseT]):
 
     @classmethod
     def save_rbac_tree(cls, file: str):
-        """保存RBAC树"""
-        cls._rbac_manager.save_to_file(file)
+        """保存RBAC树（目录不存在时才创建）"""
+        try:
+            cls._rbac_manager.save_to_file(file)
+        except FileNotFoundError:
+            Path(file).parent.mkdir(parents=True, exist_ok=True)
+            cls._rbac_manager.save_to_file(file)
 
     @classmethod
     def get_current(cls) -> Self:
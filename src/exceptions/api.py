@@ -0,0 +1,16 @@
+import asyncio
+
+from . import SDKError
+
+
+class ApiTimeout(SDKError, asyncio.TimeoutError):
+    """API 调用在限定时间内未收到响应
+
+    同时是 asyncio.TimeoutError 的子类，原有的超时捕获仍然生效
+    """
+
+    def __init__(self, protocol_name: str, action: str, timeout: float):
+        self.protocol_name = protocol_name
+        self.action = action
+        self.timeout = timeout
+        super().__init__(f"协议 {protocol_name} 调用 {action} 超时（{timeout}s）")
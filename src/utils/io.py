@@ -4,6 +4,7 @@ import io
 import logging
 import mimetypes
 import os
+import re
 import tempfile
 import time
 from dataclasses import dataclass, field
@@ -25,6 +26,9 @@ DEFAULT_TIMEOUT = 30
 # 特殊常量：忽略缓存大小限制
 IGNORE_CACHE_LIMIT = False
 
+# Content-Disposition 中的文件名
+_FILENAME_RE = re.compile(r'filename=["\']?([^"\']+)["\']?')
+
 # 日志
 logger = logging.getLogger(__name__)
 
@@ -501,11 +505,7 @@ class Resource:
             # 从Content-Disposition获取文件名
             content_disposition = response.headers.get("Content-Disposition", "")
             if "filename=" in content_disposition:
-                import re
-
-                match = re.search(
-                    r'filename=["\']?([^"\']+)["\']?', content_disposition
-                )
+                match = _FILENAME_RE.search(content_disposition)
                 if match:
                     filename = match.group(1)
 
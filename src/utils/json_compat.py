@@ -0,0 +1,23 @@
+"""JSON 编解码：可选依赖 orjson（perf）存在时使用，否则回退到标准库 json
+
+loads 失败时抛出的异常都是 json.JSONDecodeError（orjson 的异常是其子类）
+"""
+import json
+from typing import Any
+
+__all__ = ["loads", "dumps"]
+
+try:
+    import orjson
+except ImportError:
+    loads = json.loads
+    dumps = json.dumps
+else:
+    loads = orjson.loads
+
+    # 与 json.dumps 一致：允许 int 等非字符串键
+    _DUMPS_OPTION = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> str:
+        # 返回 str，保持以文本帧发送
+        return orjson.dumps(obj, option=_DUMPS_OPTION).decode()
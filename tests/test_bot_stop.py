@@ -0,0 +1,87 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.__main__ import Bot
+from src.connector import AsyncWebSocketClient
+from src.plugins_system import SimpleEventBus
+from src.utils.constants import DefaultSetting
+
+
+def _make_bot(tmp_path, monkeypatch) -> tuple[Bot, dict]:
+    """构造不连真实服务器的 Bot，并统计清理函数的调用次数"""
+    # 默认事件总线是进程级的，Bot 停止时会被关闭，每个用例单独一个
+    monkeypatch.setattr(DefaultSetting, "event_bus", SimpleEventBus())
+    bot = Bot(
+        root_id=1,
+        url="ws://127.0.0.1:1",
+        token="t",
+        config_dir=tmp_path / "config",
+        data_dir=tmp_path / "data",
+    )
+    calls = {"plugin_sys.stop": 0, "protocol.logout": 0}
+    client = None
+
+    async def login(url, token, **kwd):
+        nonlocal client
+        # login 只返回未启动的客户端
+        client = AsyncWebSocketClient(url)
+        return client
+
+    async def logout():
+        calls["protocol.logout"] += 1
+        await client.stop()
+
+    plugin_stop = bot.plugin_sys.stop
+
+    async def stop_plugins():
+        calls["plugin_sys.stop"] += 1
+        await plugin_stop()
+
+    monkeypatch.setattr(bot.protocol, "login", login)
+    monkeypatch.setattr(bot.protocol, "logout", logout)
+    monkeypatch.setattr(bot.plugin_sys, "stop", stop_plugins)
+    return bot, calls
+
+
+async def _wait_receiving(bot: Bot) -> None:
+    """等到收消息循环开始等待"""
+    while bot.listener is None or bot._print_task is None:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+
+
+def test_stop_makes_run_async_return(tmp_path, monkeypatch):
+    bot, calls = _make_bot(tmp_path, monkeypatch)
+
+    async def main():
+        task = asyncio.create_task(bot.run_async())
+        await _wait_receiving(bot)
+
+        await bot.stop()
+        await asyncio.wait_for(task, 2)
+        assert not Bot.running
+
+    asyncio.run(main())
+    assert calls == {"plugin_sys.stop": 1, "protocol.logout": 1}
+
+
+def test_run_cleans_up_once_when_stopped_from_a_task(tmp_path, monkeypatch):
+    bot, calls = _make_bot(tmp_path, monkeypatch)
+    login = bot.protocol.login
+
+    async def login_and_schedule_stop(url, token, **kwd):
+        async def stop_later():
+            await _wait_receiving(bot)
+            await bot.stop()
+
+        # 模拟插件在运行中调用 bot.stop()
+        asyncio.get_running_loop().create_task(stop_later())
+        return await login(url, token, **kwd)
+
+    monkeypatch.setattr(bot.protocol, "login", login_and_schedule_stop)
+
+    bot.run()
+    assert not Bot.running
+    assert calls == {"plugin_sys.stop": 1, "protocol.logout": 1}
@@ -1,31 +1,27 @@
-def test_requirements_sync_with_pyproject():
-    req_lines = []
-    with open("requirements.txt", "r", encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            req_lines.append(line)
+import sys
+from pathlib import Path
+
+import pytest
 
-    # 从 pyproject.toml 中取出 dependencies 列表（简单文本解析，适用于常见格式）
-    with open("pyproject.toml", "r", encoding="utf-8") as fh:
-        data = fh.read()
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    tomllib = pytest.importorskip("tomli")
 
-    deps_block = ""
-    start = data.find("dependencies = [")
-    if start != -1:
-        start = data.find("[", start)
-        end = data.find("]", start)
-        deps_block = data[start + 1 : end]
 
-    py_deps = []
-    for item in deps_block.splitlines():
-        item = item.strip().rstrip(",")
-        if not item:
-            continue
-        # 去掉引号
-        item = item.strip(" '\"\n")
-        py_deps.append(item)
+def test_requirements_sync_with_pyproject():
+    req_lines = [
+        line
+        for line in map(
+            str.strip,
+            Path("requirements.txt").read_text(encoding="utf-8").splitlines(),
+        )
+        if line and not line.startswith("#")
+    ]
+
+    # 从 pyproject.toml 中取出 dependencies 列表
+    with open("pyproject.toml", "rb") as fh:
+        py_deps = set(tomllib.load(fh)["project"]["dependencies"])
 
     # 要求 requirements.txt 中的每一项都至少在 pyproject dependencies 中出现
     for req in req_lines: